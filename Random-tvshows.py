@@ -1,9 +1,44 @@
+import atexit
+import bisect
+import mmap
+import os
 import random
+import sys
 import json
+import time
 from pathlib import Path
 from typing import Dict, List
 import datetime
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # Fall back to the slower stdlib encoder
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:  # Fall back to a plain list kept sorted with bisect
+
+    class SortedList(list):
+        """Minimal stand-in for the parts of sortedcontainers.SortedList used here"""
+
+        def __init__(self, iterable=()):
+            super().__init__(sorted(iterable))
+
+        def add(self, value):
+            bisect.insort(self, value)
+
+        def bisect_left(self, value) -> int:
+            return bisect.bisect_left(self, value)
+
+
 # ANSI color codes for terminal formatting
 COLORS = {
     "RED": "\033[91m",
@@ -15,8 +50,26 @@ COLORS = {
     "BOLD": "\033[1m",
     "RESET": "\033[0m",
 }
+RED, GREEN, YELLOW, BLUE, MAGENTA, CYAN, BOLD, RESET = (
+    COLORS[name]
+    for name in ("RED", "GREEN", "YELLOW", "BLUE", "MAGENTA", "CYAN", "BOLD", "RESET")
+)
 
 SAVE_FILE = "tv_show_progress.json"
+_SAVE_PATH = Path(SAVE_FILE)
+_BACKUP_PATH = _SAVE_PATH.with_suffix(".bak")
+_TMP_PATH = _SAVE_PATH.with_suffix(".tmp")
+# Number of logged events after which the save file is compacted to a snapshot
+COMPACT_EVERY = 1000
+# Number of logged events buffered in memory before they are flushed to disk
+FLUSH_EVERY = 10
+
+
+def _to_epoch(timestamp) -> float:
+    """Convert a legacy ISO timestamp to seconds since the epoch"""
+    if isinstance(timestamp, str):
+        return datetime.datetime.fromisoformat(timestamp).timestamp()
+    return timestamp
 
 
 class ShowSelector:
@@ -24,15 +77,39 @@ class ShowSelector:
 
     def __init__(self, shows: List[str]):
         self.original_order = shows.copy()
-        self.remaining_shows = shows.copy()
-        self.watched_shows: List[Dict] = []
+        # Watched shows are stored as parallel name/timestamp lists
+        self._watched_names: List[str] = []
+        self._watched_timestamps: List[float] = []
         self.total_shows = len(shows)
-        self.history: List[Dict] = []
+        self._log = None
+        self._events = 0
+        self._dirty = False
 
-        if Path(SAVE_FILE).exists():
+        if _SAVE_PATH.exists():
             self.load_progress(shows)
         else:
             self.total_shows = len(self.original_order)
+            self._refresh_lookups(shows)
+
+    def _refresh_lookups(self, remaining: List[str]):
+        """Rebuild lookup structures derived from original_order"""
+        self._folded_names = {s.casefold() for s in self.original_order}
+        self._orig_index = {s: i for i, s in enumerate(self.original_order)}
+        # Remaining shows are tracked as sorted original_order indices
+        self._remaining_idx = SortedList(self._orig_index[s] for s in remaining)
+
+    @property
+    def remaining_shows(self) -> List[str]:
+        """Shows not yet watched, in original order"""
+        return [self.original_order[i] for i in self._remaining_idx]
+
+    @property
+    def watched_shows(self) -> List[Dict]:
+        """Watched shows with their selection timestamps, oldest first"""
+        return [
+            {"show": name, "timestamp": timestamp}
+            for name, timestamp in zip(self._watched_names, self._watched_timestamps)
+        ]
 
     def add_show(self, show_name: str) -> bool:
         """Add a new show to the system if not already exists (case-insensitive)"""
@@ -41,223 +118,343 @@ class ShowSelector:
             return False
 
         # Case-insensitive check
-        if any(show_name.lower() == s.lower() for s in self.original_order):
+        folded = show_name.casefold()
+        if folded in self._folded_names:
             return False
 
+        self._folded_names.add(folded)
+        self._append_show(show_name)
+        self._log_event({"op": "add", "show": show_name})
+        return True
+
+    def _append_show(self, show_name: str):
+        """Append a show to original_order and the remaining indices"""
+        index = len(self.original_order)
+        self._orig_index[show_name] = index
         self.original_order.append(show_name)
-        self.remaining_shows.append(show_name)
+        self._remaining_idx.add(index)
         self.total_shows = len(self.original_order)
-        self.save_progress()
-        return True
 
-    def select_show(self) -> Dict[str, str]:
+    def select_show(self) -> Dict:
         """Randomly select and move a show from remaining to watched"""
-        if not self.remaining_shows:
+        if not self._remaining_idx:
             return None
 
-        selected = random.choice(self.remaining_shows)
-        selection = {
-            "show": selected,
-            "timestamp": datetime.datetime.now().isoformat(),
-            "action": "watched",
-        }
+        # Pop by position: no value search, and the index list stays sorted
+        index = self._remaining_idx.pop(random.randrange(len(self._remaining_idx)))
+        selected = self.original_order[index]
+        timestamp = time.time()
+        selection = {"show": selected, "timestamp": timestamp}
 
-        self.watched_shows.append(selection)
-        self.remaining_shows.remove(selected)
-        self.history.append(selection)
-        self.save_progress()
+        self._watched_names.append(selected)
+        self._watched_timestamps.append(timestamp)
+        self._log_event({"op": "watch", "show": selected, "timestamp": timestamp})
 
         return selection
 
-    def undo_last(self) -> Dict[str, str]:
+    def undo_last(self) -> Dict:
         """Undo the last selection while maintaining original order"""
-        if not self.history:
-            return None
+        last_selection = self._undo()
+        if last_selection:
+            self._log_event({"op": "undo"})
+        return last_selection
 
-        last_selection = self.history.pop()
-        show_to_restore = last_selection["show"]
+    def _undo(self) -> Dict:
+        """Move the most recent selection back into the remaining shows"""
+        if not self._watched_names:
+            return None
 
-        try:
-            original_index = self.original_order.index(show_to_restore)
-        except ValueError:
-            original_index = len(self.original_order)
-
-        insert_index = 0
-        for idx, show in enumerate(self.remaining_shows):
-            if self.original_order.index(show) > original_index:
-                insert_index = idx
-                break
-        else:
-            insert_index = len(self.remaining_shows)
+        show = self._watched_names.pop()
+        timestamp = self._watched_timestamps.pop()
+        self._remaining_idx.add(self._orig_index[show])
 
-        self.remaining_shows.insert(insert_index, show_to_restore)
-        self.watched_shows.remove(last_selection)
-        self.save_progress()
-
-        return last_selection
+        return {"show": show, "timestamp": timestamp}
 
     def get_progress(self) -> Dict:
         """Get current viewing progress statistics"""
         return {
-            "watched": len(self.watched_shows),
-            "remaining": len(self.remaining_shows),
+            "watched": len(self._watched_names),
+            "remaining": len(self._remaining_idx),
             "total": self.total_shows,
-            "percentage": round((len(self.watched_shows) / self.total_shows) * 100, 1)
+            "percentage": round((len(self._watched_names) / self.total_shows) * 100, 1)
             if self.total_shows
             else 0.0,
         }
 
     def save_progress(self):
-        """Save current state to file"""
-        with open(SAVE_FILE, "w") as f:
-            json.dump(
-                {
-                    "original_order": self.original_order,
-                    "remaining": self.remaining_shows,
-                    "watched": self.watched_shows,
-                    "history": self.history,
-                },
-                f,
-                indent=2,
+        """Save a snapshot of the current state, truncating the event log"""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+            self._dirty = False
+
+        payload = self._fast_dump()
+        # Write to a temp file and swap it in so a crash never truncates the save
+        with open(_TMP_PATH, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(_TMP_PATH, _SAVE_PATH)
+        self._events = 0
+
+    def _fast_dump(self) -> bytes:
+        """Encode the current state as a one-line JSON snapshot"""
+        return b"".join(
+            (
+                b'{"original_order":',
+                _dumps(self.original_order),
+                b',"remaining":',
+                _dumps(self.remaining_shows),
+                b',"watched_names":',
+                _dumps(self._watched_names),
+                b',"watched_timestamps":',
+                _dumps(self._watched_timestamps),
+                b"}\n",
             )
+        )
+
+    def _log_event(self, event: Dict):
+        """Append a single state change to the save file"""
+        if self._log is None:
+            if not _SAVE_PATH.exists():
+                # Nothing to append to yet; the snapshot already has the change
+                self.save_progress()
+                return
+            self._log = open(_SAVE_PATH, "ab")
+
+        self._log.write(_dumps(event) + b"\n")
+        self._dirty = True
+        self._events += 1
+        if self._events >= COMPACT_EVERY:
+            self.save_progress()
+        elif self._events % FLUSH_EVERY == 0:
+            self.flush()
+
+    def flush(self):
+        """Write buffered events to the save file"""
+        if self._dirty:
+            self._log.flush()
+            self._dirty = False
+
+    def _replay(self, event: Dict):
+        """Re-apply a logged state change while loading"""
+        op = event["op"]
+        if op == "watch":
+            show, timestamp = event["show"], _to_epoch(event["timestamp"])
+            index = self._orig_index[show]
+            pos = self._remaining_idx.bisect_left(index)
+            if pos == len(self._remaining_idx) or self._remaining_idx[pos] != index:
+                raise ValueError(f"Watched show is not remaining: {show}")
+            del self._remaining_idx[pos]
+            self._watched_names.append(show)
+            self._watched_timestamps.append(timestamp)
+        elif op == "add":
+            self._folded_names.add(event["show"].casefold())
+            self._append_show(event["show"])
+        elif op == "undo":
+            self._undo()
+        else:
+            raise ValueError(f"Unknown event in save file: {op}")
+
+    @staticmethod
+    def _read_save(path) -> tuple:
+        """Read a save file as (snapshot, events, needs_rewrite)"""
+        with open(path, "rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                raise json.JSONDecodeError("Empty save file", "", 0)
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                first = mm.readline()
+                try:
+                    data = _loads(first)
+                except json.JSONDecodeError:
+                    return _loads(mm[:]), [], True
+                if not first.endswith(b"\n"):
+                    return data, [], True
+
+                events = []
+                for line in iter(mm.readline, b""):
+                    if not line.endswith(b"\n"):
+                        return data, events, True
+                    try:
+                        events.append(_loads(line))
+                    except ValueError:
+                        # Keep the events before a damaged line and drop the rest
+                        return data, events, True
+
+        return data, events, False
+
+    @staticmethod
+    def _normalize_watched(data: Dict):
+        """Convert legacy watched entries to parallel lists of epoch timestamps"""
+        if "watched" in data:
+            names = [s["show"] for s in data["watched"]]
+            timestamps = [s["timestamp"] for s in data["watched"]]
+            del data["watched"]
+            data["watched_names"] = names
+            data["watched_timestamps"] = timestamps
+        if "watched_timestamps" in data:
+            data["watched_timestamps"] = [
+                _to_epoch(t) for t in data["watched_timestamps"]
+            ]
 
     def load_progress(self, initial_shows: List[str]):
         """Load progress from file with advanced corruption handling"""
-        backup_file = Path(SAVE_FILE).with_suffix(".bak")
         data = None
 
         try:
-            with open(SAVE_FILE, "r") as f:
-                data = json.load(f)
+            data, events, needs_rewrite = self._read_save(_SAVE_PATH)
+            required_keys = [
+                "original_order",
+                "remaining",
+                "watched_names",
+                "watched_timestamps",
+            ]
+            self._normalize_watched(data)
 
             # Validate required keys
-            required_keys = ["original_order", "remaining", "watched", "history"]
             if not all(key in data for key in required_keys):
                 raise KeyError("Missing required keys in save file")
 
             # Validate data types
-            if not (
-                isinstance(data["original_order"], list)
-                and isinstance(data["remaining"], list)
-                and isinstance(data["watched"], list)
-                and isinstance(data["history"], list)
-            ):
+            if not all(isinstance(data[key], list) for key in required_keys):
                 raise ValueError("Invalid data types in save file")
+            if len(data["watched_names"]) != len(data["watched_timestamps"]):
+                raise ValueError("Mismatched watched lists in save file")
 
-            self.original_order = data["original_order"]
-            self.remaining_shows = data["remaining"]
-            self.watched_shows = data["watched"]
-            self.history = data["history"]
+            # Replay into copies so a failed event leaves data intact for recovery
+            self.original_order = list(data["original_order"])
+            self._watched_names = list(data["watched_names"])
+            self._watched_timestamps = list(data["watched_timestamps"])
             self.total_shows = len(self.original_order)
+            self._refresh_lookups(data["remaining"])
+            for event in events:
+                self._replay(event)
+
+            if needs_rewrite:
+                self.save_progress()
+            else:
+                self._events = len(events)
 
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            print(f"{COLORS['RED']}⚠️ Corrupted save file: {str(e)}{COLORS['RESET']}")
+        except (
+            json.JSONDecodeError,
+            AttributeError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ) as e:
+            print(f"{RED}⚠️ Corrupted save file: {str(e)}{RESET}")
 
             # Create backup of corrupted file
-            if Path(SAVE_FILE).exists():
-                print(
-                    f"{COLORS['YELLOW']}Creating backup at {backup_file}{COLORS['RESET']}"
-                )
-                Path(SAVE_FILE).rename(backup_file)
+            if _SAVE_PATH.exists():
+                print(f"{YELLOW}Creating backup at {_BACKUP_PATH}{RESET}")
+                _SAVE_PATH.rename(_BACKUP_PATH)
 
             # Try to load from backup
             try:
-                if backup_file.exists():
-                    with open(backup_file, "r") as f:
-                        backup_data = json.load(f)
+                if _BACKUP_PATH.exists():
+                    backup_data, backup_events, _ = self._read_save(_BACKUP_PATH)
+                    self._normalize_watched(backup_data)
 
                     if not all(key in backup_data for key in required_keys):
                         raise KeyError("Backup file missing keys")
 
-                    self.original_order = backup_data["original_order"]
-                    self.remaining_shows = backup_data["remaining"]
-                    self.watched_shows = backup_data["watched"]
-                    self.history = backup_data["history"]
+                    self.original_order = list(backup_data["original_order"])
+                    self._watched_names = list(backup_data["watched_names"])
+                    self._watched_timestamps = list(backup_data["watched_timestamps"])
                     self.total_shows = len(self.original_order)
-                    print(
-                        f"{COLORS['GREEN']}✔️ Successfully loaded from backup{COLORS['RESET']}"
-                    )
+                    self._refresh_lookups(backup_data["remaining"])
+                    for event in backup_events:
+                        self._replay(event)
+                    print(f"{GREEN}✔️ Successfully loaded from backup{RESET}")
                     return
             except Exception as backup_error:
-                print(
-                    f"{COLORS['RED']}⚠️ Backup load failed: {str(backup_error)}{COLORS['RESET']}"
-                )
+                print(f"{RED}⚠️ Backup load failed: {str(backup_error)}{RESET}")
 
             # Attempt data recovery from corrupted data
             try:
-                remaining = data.get("remaining", []) if data else []
-                watched = data.get("watched", []) if data else []
-                history = data.get("history", []) if data else []
+                data = data or {}
+                self._normalize_watched(data)
+                remaining = data.get("remaining", [])
+                watched = list(
+                    zip(
+                        data.get("watched_names", []),
+                        data.get("watched_timestamps", []),
+                    )
+                )
 
                 # Reconstruct original_order from remaining + watched shows
-                watched_shows = [s["show"] for s in watched]
-                all_shows = remaining + watched_shows
+                all_shows = remaining + [name for name, _ in watched]
                 seen = set()
                 recovered_order = []
                 for show in all_shows + initial_shows:
-                    if show.lower() not in seen:
-                        seen.add(show.lower())
+                    folded = show.casefold()
+                    if folded not in seen:
+                        seen.add(folded)
                         recovered_order.append(show)
 
                 self.original_order = recovered_order
-                self.remaining_shows = remaining
-                self.watched_shows = watched
-                self.history = history
                 self.total_shows = len(self.original_order)
 
                 print(
-                    f"{COLORS['GREEN']}✔️ Recovered {self.total_shows} shows from corrupted data{COLORS['RESET']}"
+                    f"{GREEN}✔️ Recovered {self.total_shows} shows from corrupted data{RESET}"
                 )
 
-                # Validate remaining shows exist in original_order
-                self.remaining_shows = [
-                    s for s in self.remaining_shows if s in self.original_order
-                ]
-                # Validate watched shows exist in original_order
-                self.watched_shows = [
-                    s for s in self.watched_shows if s["show"] in self.original_order
-                ]
+                # Validate remaining and watched shows exist in original_order
+                in_order = set(self.original_order).__contains__
+                self._refresh_lookups([s for s in remaining if in_order(s)])
+                watched = [(name, ts) for name, ts in watched if in_order(name)]
+                self._watched_names = [name for name, _ in watched]
+                self._watched_timestamps = [ts for _, ts in watched]
 
             except Exception as recovery_error:
-                print(
-                    f"{COLORS['RED']}⚠️ Data recovery failed: {str(recovery_error)}{COLORS['RESET']}"
-                )
-                print(
-                    f"{COLORS['YELLOW']}⚠️ Resetting to initial show list{COLORS['RESET']}"
-                )
+                print(f"{RED}⚠️ Data recovery failed: {str(recovery_error)}{RESET}")
+                print(f"{YELLOW}⚠️ Resetting to initial show list{RESET}")
                 self.original_order = initial_shows.copy()
-                self.remaining_shows = initial_shows.copy()
-                self.watched_shows = []
-                self.history = []
+                self._watched_names = []
+                self._watched_timestamps = []
                 self.total_shows = len(initial_shows)
+                self._refresh_lookups(initial_shows)
 
             self.save_progress()
 
 
+# Every possible progress bar, indexed by the number of filled cells
+_BARS = [f"{GREEN}{'█' * filled}{RESET}{'-' * (30 - filled)}" for filled in range(31)]
+
+
 def display_progress_bar(percentage: float):
     """Display a visual progress bar with precise calculation"""
-    filled = int(round(percentage / (100 / 30)))
-    bar = f"{COLORS['GREEN']}{'█' * filled}{COLORS['RESET']}{'-' * (30 - filled)}"
-    print(f"\nProgress: {bar} {percentage}%")
+    filled = int(round(percentage * 0.3))
+    print(f"\nProgress: {_BARS[filled]} {percentage}%")
+
+
+_MENU_STR = (
+    f"\n{BOLD}{MAGENTA}Main Menu{RESET}\n"
+    f"{CYAN}1. Pick random show\n"
+    "2. Undo last selection\n"
+    "3. View watched list\n"
+    "4. View remaining shows\n"
+    "5. Add new TV show\n"
+    f"6. Exit{RESET}\n"
+)
+_MENU_PROMPT = f"{YELLOW}⟳ Enter your choice (1-6): {RESET}"
 
 
 def show_menu() -> str:
     """Display interactive menu and get user choice"""
-    print(f"\n{COLORS['BOLD']}{COLORS['MAGENTA']}Main Menu{COLORS['RESET']}")
-    print(f"{COLORS['CYAN']}1. Pick random show")
-    print("2. Undo last selection")
-    print("3. View watched list")
-    print("4. View remaining shows")
-    print("5. Add new TV show")
-    print(f"6. Exit{COLORS['RESET']}")
-    return input(
-        f"{COLORS['YELLOW']}⟳ Enter your choice (1-6): {COLORS['RESET']}"
-    ).strip()
+    sys.stdout.write(_MENU_STR)
+    return input(_MENU_PROMPT).strip()
+
+
+def format_timestamp(timestamp: float, fmt: str = "%Y-%m-%d %H:%M") -> str:
+    """Format an epoch timestamp in local time for display"""
+    return time.strftime(fmt, time.localtime(timestamp))
 
 
 def print_header(text: str):
     """Print section headers with formatting"""
-    print(f"\n{COLORS['BOLD']}{COLORS['MAGENTA']}▶ {text}{COLORS['RESET']}")
+    print(f"\n{BOLD}{MAGENTA}▶ {text}{RESET}")
 
 
 def main():
@@ -315,11 +512,12 @@ def main():
     ]
 
     selector = ShowSelector(initial_shows)
+    atexit.register(selector.flush)
 
     print(
-        f"\n{COLORS['BOLD']}{COLORS['MAGENTA']}"
+        f"\n{BOLD}{MAGENTA}"
         "░▒▓███████▓▒░ TV Show Selection Assistant ░▒▓███████▓▒░"
-        f"{COLORS['RESET']}"
+        f"{RESET}"
     )
 
     try:
@@ -330,70 +528,73 @@ def main():
             if choice == "1":
                 selection = selector.select_show()
                 if not selection:
-                    print(f"\n{COLORS['GREEN']}🎉 All shows watched!{COLORS['RESET']}")
+                    print(f"\n{GREEN}🎉 All shows watched!{RESET}")
                     continue
 
                 print_header("New Selection")
-                print(f"{COLORS['CYAN']}📺 Show: {selection['show']}")
-                print(
-                    f"⏰ Selected at: {selection['timestamp'][:16].replace('T', ' ')}"
-                )
+                print(f"{CYAN}📺 Show: {selection['show']}")
+                print(f"⏰ Selected at: {format_timestamp(selection['timestamp'])}")
                 display_progress_bar(progress["percentage"])
 
             elif choice == "2":
                 undone = selector.undo_last()
                 if undone:
                     print_header("Undo Successful")
-                    print(
-                        f"{COLORS['YELLOW']}↩️ Undid: {undone['show']}{COLORS['RESET']}"
-                    )
+                    print(f"{YELLOW}↩️ Undid: {undone['show']}{RESET}")
                     display_progress_bar(selector.get_progress()["percentage"])
                 else:
-                    print(f"{COLORS['RED']}⚠️ Nothing to undo!{COLORS['RESET']}")
+                    print(f"{RED}⚠️ Nothing to undo!{RESET}")
 
             elif choice == "3":
                 print_header("Watched Shows")
-                if not selector.watched_shows:
-                    print(f"{COLORS['YELLOW']}No shows watched yet.{COLORS['RESET']}")
+                watched = selector.watched_shows
+                if not watched:
+                    print(f"{YELLOW}No shows watched yet.{RESET}")
                 else:
-                    for idx, show in enumerate(selector.watched_shows, 1):
-                        print(f"{idx}. {show['show']} ({show['timestamp'][:10]})")
+                    print(
+                        "\n".join(
+                            f"{idx}. {show['show']} "
+                            f"({format_timestamp(show['timestamp'], '%Y-%m-%d')})"
+                            for idx, show in enumerate(watched, 1)
+                        )
+                    )
 
             elif choice == "4":
                 print_header("Remaining Shows")
-                if not selector.remaining_shows:
-                    print(f"{COLORS['GREEN']}All shows watched! 🎉{COLORS['RESET']}")
+                remaining = selector.remaining_shows
+                if not remaining:
+                    print(f"{GREEN}All shows watched! 🎉{RESET}")
                 else:
-                    for idx, show in enumerate(selector.remaining_shows, 1):
-                        print(f"{idx}. {show}")
+                    print(
+                        "\n".join(
+                            f"{idx}. {show}"
+                            for idx, show in enumerate(remaining, 1)
+                        )
+                    )
 
             elif choice == "5":
                 print_header("Add New TV Show")
-                new_show = input(
-                    f"{COLORS['YELLOW']}Enter show name: {COLORS['RESET']}"
-                ).strip()
+                new_show = input(f"{YELLOW}Enter show name: {RESET}").strip()
                 if selector.add_show(new_show):
-                    print(f"{COLORS['GREEN']}✅ Added '{new_show}' to collection!")
+                    print(f"{GREEN}✅ Added '{new_show}' to collection!")
                 else:
-                    print(f"{COLORS['RED']}⚠️ Show already exists or invalid name.")
-                print(
-                    f"{COLORS['CYAN']}Total shows now: {selector.total_shows}{COLORS['RESET']}"
-                )
+                    print(f"{RED}⚠️ Show already exists or invalid name.")
+                print(f"{CYAN}Total shows now: {selector.total_shows}{RESET}")
 
             elif choice == "6":
                 print(
-                    f"\n{COLORS['YELLOW']}📊 Final Stats: {progress['watched']} watched, "
-                    f"{progress['remaining']} remaining{COLORS['RESET']}"
+                    f"\n{YELLOW}📊 Final Stats: {progress['watched']} watched, "
+                    f"{progress['remaining']} remaining{RESET}"
                 )
+                selector.flush()
                 break
 
             else:
-                print(f"{COLORS['RED']}⚠️ Invalid choice!{COLORS['RESET']}")
+                print(f"{RED}⚠️ Invalid choice!{RESET}")
 
     except KeyboardInterrupt:
-        print(
-            f"\n{COLORS['RED']}🚨 Session interrupted. Progress saved.{COLORS['RESET']}"
-        )
+        selector.flush()
+        print(f"\n{RED}🚨 Session interrupted. Progress saved.{RESET}")
 
 
 if __name__ == "__main__":